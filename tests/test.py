@@ -1,7 +1,48 @@
+import asyncio
+import importlib.util
+import io
+import logging
+import os
+import tempfile
+import threading
 import unittest
-from unittest.mock import MagicMock, mock_open, patch
+import weakref
+from datetime import datetime, timezone
+from unittest.mock import AsyncMock, MagicMock, patch
 
-from truthautonomy import MediaResponse, PostResponse, TruthSocial, TruthSocialAPIError
+import cloudscraper
+import orjson
+import requests
+from curl_cffi import CurlMime
+from curl_cffi import requests as curl_requests
+from curl_cffi.requests.exceptions import Timeout
+from urllib3 import HTTPResponse
+
+from truthautonomy import (
+    AsyncTruthSocial,
+    MediaResponse,
+    PostResponse,
+    TruthSocial,
+    TruthSocialAPIError,
+)
+from truthautonomy.api import (
+    _cached_user,
+    _next_page_link,
+    _parse_json,
+    _ratelimit_delay,
+    _search_offsets,
+)
+from truthautonomy.utils import setup_logger
+
+
+def mock_response(status_code=200, data=None, headers=None, text=""):
+    """Builds a mocked ``requests.Response`` carrying a JSON body."""
+    response = MagicMock(spec=requests.Response)
+    response.status_code = status_code
+    response.headers = headers or {}
+    response.content = orjson.dumps(data)
+    response.text = text
+    return response
 
 
 class TestTruthSocial(unittest.TestCase):
@@ -9,6 +50,16 @@ class TestTruthSocial(unittest.TestCase):
         """Set up reusable test variables."""
         self.auth_bearer = "test_bearer_token"
         self.api = TruthSocial(auth_bearer=self.auth_bearer)
+        self.addCleanup(self.api.close)
+
+    def media_file(self, name: str) -> str:
+        """Writes a throwaway media file and returns its path."""
+        tmp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp_dir.cleanup)
+        path = os.path.join(tmp_dir.name, name)
+        with open(path, "wb") as file:
+            file.write(b"mock data")
+        return path
 
     def test_initialization(self):
         """Test initialization with and without an auth token."""
@@ -18,69 +69,651 @@ class TestTruthSocial(unittest.TestCase):
             self.api.headers["Authorization"], f"Bearer {self.auth_bearer}"
         )
 
-    @patch("truthautonomy.TruthSocial.cfs.post")
+    def test_headers_setter(self):
+        """Test that replacing the headers rebuilds the JSON headers."""
+        self.api.headers = {"Authorization": "Bearer other_token"}
+        self.assertEqual(
+            self.api._json_headers,
+            {"Authorization": "Bearer other_token", "Content-Type": "application/json"},
+        )
+        self.assertEqual(self.api.cfs.headers["Authorization"], "Bearer other_token")
+        self.assertNotIn("Origin", self.api.cfs.headers)
+
+    def test_headers_read_only(self):
+        """Test that the headers cannot be changed in place."""
+        with self.assertRaises(TypeError):
+            self.api.headers["Authorization"] = "Bearer other_token"
+        self.assertEqual(
+            self.api.cfs.headers["Authorization"], f"Bearer {self.auth_bearer}"
+        )
+
+    def test_default_session(self):
+        """Test that requests go through an impersonating curl_cffi session."""
+        self.assertIsInstance(self.api.cfs, curl_requests.Session)
+        self.assertNotIn("User-Agent", self.api.headers)
+        self.assertEqual(
+            self.api.cfs.headers["Authorization"], f"Bearer {self.auth_bearer}"
+        )
+
+    def test_close_frees_worker_handles(self):
+        """Test that closing the client frees the curl handles of its workers."""
+        with TruthSocial(auth_bearer=self.auth_bearer) as api:
+            handle = api._executor.submit(lambda: weakref.ref(api.cfs.curl)).result()
+            self.assertIsNotNone(handle())
+        self.assertIsNone(handle())
+
+    @patch.dict(os.environ, {"TRUTHAUTONOMY_CLOUDSCRAPER": "1"})
+    def test_session_adapter(self):
+        """Test that the cloudscraper fallback pools connections and retries."""
+        api = TruthSocial(auth_bearer=self.auth_bearer)
+        self.addCleanup(api.close)
+        self.assertIsInstance(api.cfs, cloudscraper.CloudScraper)
+        adapter = api.cfs.get_adapter(TruthSocial.BASE_URL)
+        self.assertEqual(adapter._pool_maxsize, 20)
+        self.assertEqual(adapter.max_retries.total, 3)
+        self.assertEqual(api.cfs.headers["Authorization"], f"Bearer {self.auth_bearer}")
+
+    @patch.dict(os.environ, {"TRUTHAUTONOMY_CLOUDSCRAPER": "1"})
+    @patch("cloudscraper.Cloudflare.is_Challenge_Request", return_value=False)
+    @patch("urllib3.connectionpool.HTTPConnectionPool._make_request")
+    def test_session_adapter_passes_challenge(self, mock_request, mock_challenge):
+        """Test that the adapter hands Cloudflare's 503 challenge to cloudscraper."""
+        mock_request.return_value = HTTPResponse(
+            body=io.BytesIO(b"challenge"),
+            headers={"Server": "cloudflare"},
+            status=503,
+            preload_content=False,
+        )
+        api = TruthSocial(auth_bearer=self.auth_bearer)
+        self.addCleanup(api.close)
+        response = api.cfs.get(TruthSocial.BASE_URL + "/api/v1/instance")
+        self.assertEqual(response.status_code, 503)
+        mock_request.assert_called_once()
+        mock_challenge.assert_called_once_with(response)
+
+    @patch("curl_cffi.requests.Session.post")
     def test_send_post(self, mock_post):
         """Test sending a post with valid data."""
-        mock_response = MagicMock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = {
-            "id": 1,
-            "content": "Hello, TruthSocial!",
-            "visibility": "public",
-            "url": "https://example.com/post/1",
-        }
-        mock_post.return_value = mock_response
+        mock_post.return_value = mock_response(
+            data={
+                "id": 1,
+                "content": "Hello, TruthSocial!",
+                "visibility": "public",
+                "url": "https://example.com/post/1",
+            }
+        )
 
         response = self.api.send_post(content="Hello, TruthSocial!")
         self.assertIsInstance(response, PostResponse)
         self.assertEqual(response.content, "Hello, TruthSocial!")
         self.assertEqual(response.visibility, "public")
+        payload = orjson.loads(mock_post.call_args.kwargs["data"])
+        self.assertEqual(payload["status"], "Hello, TruthSocial!")
+        self.assertEqual(
+            mock_post.call_args.kwargs["headers"]["Content-Type"], "application/json"
+        )
+
+    @patch("truthautonomy.api.time.sleep")
+    @patch("curl_cffi.requests.Session.get")
+    def test_get_retried(self, mock_get, mock_sleep):
+        """Test that GETs are retried on transport errors and 5xx responses."""
+        mock_get.side_effect = [
+            Timeout("timed out"),
+            mock_response(503),
+            mock_response(data={"id": "1"}),
+        ]
+        self.assertEqual(self.api._get("/api/v1/instance"), {"id": "1"})
+        self.assertEqual(mock_get.call_count, 3)
+
+    @patch("curl_cffi.requests.Session.get")
+    def test_get_throttled_not_retried(self, mock_get):
+        """Test that a 429 is left to the rate-limit handling instead of retried."""
+        mock_get.return_value = mock_response(429, data={"error": "Throttled"})
+        self.assertEqual(self.api._get("/api/v1/instance"), {"error": "Throttled"})
+        mock_get.assert_called_once()
+
+    @patch("curl_cffi.requests.Session.post")
+    def test_send_post_not_retried(self, mock_post):
+        """Test that a failed post is not retried."""
+        mock_post.side_effect = Timeout("timed out")
 
-    @patch("truthautonomy.TruthSocial.cfs.post")
+        with self.assertRaises(Timeout):
+            self.api.send_post(content="Hello, TruthSocial!")
+        mock_post.assert_called_once()
+
+    @patch("curl_cffi.requests.Session.post")
     def test_send_post_failure(self, mock_post):
         """Test sending a post with an API error."""
-        mock_response = MagicMock()
-        mock_response.status_code = 400
-        mock_response.text = "Bad Request"
-        mock_post.return_value = mock_response
+        mock_post.return_value = mock_response(400, text="Bad Request")
 
         with self.assertRaises(TruthSocialAPIError) as context:
             self.api.send_post(content="Invalid Content")
         self.assertEqual(context.exception.status_code, 400)
         self.assertEqual(context.exception.message, "Bad Request")
 
-    @patch("truthautonomy.TruthSocial.cfs.post")
-    @patch("builtins.open", new_callable=mock_open, read_data="mock data")
-    def test_upload_media(self, mock_open_file, mock_post):
+    @patch("curl_cffi.requests.Session.post")
+    def test_upload_media(self, mock_post):
         """Test uploading a media file."""
-        mock_response = MagicMock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = {
-            "id": 123,
-            "type": "image",
-            "url": "https://example.com/media/123",
-        }
-        mock_post.return_value = mock_response
+        mock_post.return_value = mock_response(
+            data={
+                "id": 123,
+                "type": "image",
+                "url": "https://example.com/media/123",
+            }
+        )
 
-        response = self.api.upload_media("path/to/mock_file.jpg")
+        response = self.api.upload_media(self.media_file("mock_file.jpg"))
         self.assertIsInstance(response, MediaResponse)
         self.assertEqual(response.id, 123)
         self.assertEqual(response.url, "https://example.com/media/123")
+        self.assertIsInstance(mock_post.call_args.kwargs["multipart"], CurlMime)
+
+    @patch.dict(os.environ, {"TRUTHAUTONOMY_CLOUDSCRAPER": "1"})
+    @patch("cloudscraper.CloudScraper.post")
+    def test_upload_media_cloudscraper(self, mock_post):
+        """Test streaming a media file through the cloudscraper fallback."""
+        mock_post.return_value = mock_response(data={"id": 123})
 
-    @patch("truthautonomy.TruthSocial.cfs.post")
-    @patch("builtins.open", new_callable=mock_open, read_data="mock data")
-    def test_upload_media_failure(self, mock_open_file, mock_post):
+        api = TruthSocial(auth_bearer=self.auth_bearer)
+        self.addCleanup(api.close)
+        response = api.upload_media(self.media_file("mock_file.jpg"))
+        self.assertEqual(response.id, 123)
+        encoder = mock_post.call_args.kwargs["data"]
+        self.assertEqual(
+            mock_post.call_args.kwargs["headers"]["Content-Type"],
+            encoder.content_type,
+        )
+        filename, _, content_type = encoder.fields["file"]
+        self.assertEqual(filename, "mock_file.jpg")
+        self.assertEqual(content_type, "image/jpeg")
+
+    @patch("curl_cffi.requests.Session.post")
+    def test_upload_media_failure(self, mock_post):
         """Test uploading a media file with an API error."""
-        mock_response = MagicMock()
-        mock_response.status_code = 400
-        mock_response.text = "Invalid Media"
-        mock_post.return_value = mock_response
+        mock_post.return_value = mock_response(400, text="Invalid Media")
 
         with self.assertRaises(TruthSocialAPIError) as context:
-            self.api.upload_media("path/to/invalid_file.jpg")
+            self.api.upload_media(self.media_file("invalid_file.jpg"))
         self.assertEqual(context.exception.status_code, 400)
         self.assertEqual(context.exception.message, "Invalid Media")
 
+    def test_get_paginated(self):
+        """Test that pagination follows the next links until exhausted."""
+        first_page = mock_response(
+            data=[{"id": "2"}],
+            headers={"Link": '<https://truthsocial.com/api/v1/next>; rel="next"'},
+        )
+        last_page = mock_response(data=[{"id": "1"}])
+
+        with patch.object(self.api, "cfs") as mock_cfs:
+            mock_cfs.get.side_effect = [first_page, last_page]
+            pages = list(self.api._get_paginated("/api/v1/first", params={"limit": 80}))
+
+        self.assertEqual(pages, [[{"id": "2"}], [{"id": "1"}]])
+        self.assertEqual(
+            [c.args[0] for c in mock_cfs.get.call_args_list],
+            [
+                "https://truthsocial.com/api/v1/first",
+                "https://truthsocial.com/api/v1/next",
+            ],
+        )
+        self.assertEqual(
+            [c.kwargs.get("params") for c in mock_cfs.get.call_args_list],
+            [{"limit": 80}, None],
+        )
+
+    def test_get_paginated_reuses_worker(self):
+        """Test that every pagination call runs on the same worker thread."""
+        threads = set()
+
+        def get(url, params=None):
+            threads.add(threading.get_ident())
+            return mock_response(data=[])
+
+        with patch.object(self.api, "cfs") as mock_cfs:
+            mock_cfs.get.side_effect = get
+            list(self.api._get_paginated("/api/v1/first"))
+            list(self.api._get_paginated("/api/v1/second"))
+
+        self.assertEqual(len(threads), 1)
+        self.assertNotIn(threading.get_ident(), threads)
+
+    def test_get_paginated_no_prefetch_past_maximum(self):
+        """Test that no page is prefetched once the caller's maximum is fetched."""
+        first_page = mock_response(
+            data=[{"id": "2"}, {"id": "1"}],
+            headers={"Link": '<https://truthsocial.com/api/v1/next>; rel="next"'},
+        )
+
+        with patch.object(self.api, "cfs") as mock_cfs:
+            mock_cfs.get.return_value = first_page
+            likes = list(self.api.user_likes("post/1", top_num=2))
+
+        self.assertEqual(likes, [{"id": "2"}, {"id": "1"}])
+        mock_cfs.get.assert_called_once()
+
+    def test_next_page_link(self):
+        """Test extracting the next link from a Link header."""
+        link_header = (
+            '<https://truthsocial.com/api/v1/prev>; rel="prev", '
+            '<https://truthsocial.com/api/v1/next>; rel="next"'
+        )
+        self.assertEqual(
+            _next_page_link(link_header),
+            "https://truthsocial.com/api/v1/next",
+        )
+        self.assertIsNone(_next_page_link('<https://truthsocial.com/a>; rel="prev"'))
+        self.assertIsNone(_next_page_link(""))
+
+    def test_ratelimit_delay(self):
+        """Test that a delay is only computed once the rate limit is exhausted."""
+        self.assertIsNone(_ratelimit_delay({}))
+        self.assertIsNone(_ratelimit_delay({"X-RateLimit-Remaining": "5"}))
+        with patch("truthautonomy.api.time.time", return_value=1000):
+            delay = _ratelimit_delay(
+                {"X-RateLimit-Remaining": "0", "X-RateLimit-Reset": "1030"}
+            )
+        self.assertEqual(delay, 30)
+
+    def test_parse_json_cached(self):
+        """Test that a response body is deserialized only once."""
+        response = mock_response(data={"id": 1})
+        parsed = _parse_json(response)
+        self.assertEqual(parsed, {"id": 1})
+        self.assertIs(_parse_json(response), parsed)
+
+    def test_lookup_cached(self):
+        """Test that repeated lookups of a handle reuse the cached user."""
+        with patch.object(self.api, "cfs") as mock_cfs:
+            mock_cfs.get.return_value = mock_response(data={"id": "42"})
+            self.assertEqual(self.api.lookup("@user")["id"], "42")
+            self.assertEqual(self.api.lookup("user")["id"], "42")
+        mock_cfs.get.assert_called_once()
+
+        with patch("truthautonomy.api.time.monotonic", return_value=float("inf")):
+            with patch.object(self.api, "cfs") as mock_cfs:
+                mock_cfs.get.return_value = mock_response(data={"id": "42"})
+                self.api.lookup("user")
+        mock_cfs.get.assert_called_once()
+
+    def test_lookup_cache_bounded(self):
+        """Test that the lookup cache is bounded and hands out copies."""
+        with patch.object(self.api, "cfs") as mock_cfs:
+            mock_cfs.get.return_value = mock_response(data={"id": "42"})
+            self.api.lookup("user")["id"] = "mutated"
+            self.assertEqual(self.api.lookup("user")["id"], "42")
+
+            with patch.object(self.api, "LOOKUP_CACHE_SIZE", 2):
+                for handle in ("a", "b", "c"):
+                    self.api.lookup(handle)
+        self.assertEqual(list(self.api._lookup_cache), ["b", "c"])
+
+        with patch("truthautonomy.api.time.monotonic", return_value=float("inf")):
+            self.assertIsNone(_cached_user(self.api._lookup_cache, "b", 300))
+        self.assertNotIn("b", self.api._lookup_cache)
+
+    def test_handle_media_upload_order(self):
+        """Test that uploaded and existing media IDs keep their order."""
+        uploaded = {
+            "a.jpg": MediaResponse({"id": 1}),
+            "b.jpg": MediaResponse({"id": 3}),
+        }
+        with patch.object(self.api, "upload_media", side_effect=uploaded.get):
+            media_ids = self.api._handle_media_upload(["a.jpg", "2", "b.jpg"])
+        self.assertEqual(media_ids, [1, 2, 3])
+
+    def test_handle_media_upload_parallel(self):
+        """Test that media files are uploaded on the client's worker threads."""
+        threads = set()
+
+        def upload(path):
+            threads.add(threading.get_ident())
+            return MediaResponse({"id": 1})
+
+        with patch.object(self.api, "upload_media", side_effect=upload):
+            self.api._handle_media_upload(["a.jpg", "b.jpg"])
+
+        self.assertTrue(threads)
+        self.assertNotIn(threading.get_ident(), threads)
+
+    def test_pull_statuses_created_after(self):
+        """Test that pulling statuses stops at posts older than created_after."""
+        posts = [
+            {"id": "3", "created_at": "2024-03-01T00:00:00.000Z"},
+            {"id": "2", "created_at": "2024-02-01T00:00:00.000Z"},
+            {"id": "1", "created_at": "2024-01-01T00:00:00.000Z"},
+        ]
+        with patch.object(self.api, "lookup", return_value={"id": "42"}):
+            with patch.object(self.api, "_get", return_value=posts):
+                pulled = list(
+                    self.api.pull_statuses(
+                        "user", created_after=datetime(2024, 1, 15, tzinfo=timezone.utc)
+                    )
+                )
+        self.assertEqual([post["id"] for post in pulled], ["3", "2"])
+
+    def test_pull_statuses_since_id(self):
+        """Test that status IDs are ordered and compared numerically."""
+        posts = [
+            {"id": "9", "created_at": "2024-01-01T00:00:00.000Z"},
+            {"id": "100", "created_at": "2024-01-03T00:00:00.000Z"},
+            {"id": "10", "created_at": "2024-01-02T00:00:00.000Z"},
+        ]
+        with patch.object(self.api, "lookup", return_value={"id": "42"}):
+            with patch.object(self.api, "_get", return_value=posts):
+                pulled = list(self.api.pull_statuses("user", since_id="9"))
+        self.assertEqual([post["id"] for post in pulled], ["100", "10"])
+
+    @unittest.skipUnless(
+        importlib.util.find_spec("requests_cache"), "needs cache extra"
+    )
+    def test_cached_session(self):
+        """Test that the opt-in cache serves repeated idempotent GETs from disk."""
+        tmp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp_dir.cleanup)
+        self.addCleanup(os.chdir, os.getcwd())
+        os.chdir(tmp_dir.name)
+
+        api = TruthSocial(auth_bearer=self.auth_bearer, cache=True)
+        other = TruthSocial(auth_bearer="other_bearer_token", cache=True)
+        self.addCleanup(api.close)
+        self.addCleanup(other.close)
+        body = orjson.dumps({"id": "1"})
+
+        def send(request, **kwargs):
+            response = requests.Response()
+            response.status_code = 200
+            response.headers["Content-Type"] = "application/json"
+            response.raw = HTTPResponse(body=body, status=200, preload_content=False)
+            response._content = body
+            response.url = request.url
+            response.request = request
+            return response
+
+        url = api.BASE_URL + "/api/v1/trends"
+        timeline = api.BASE_URL + "/api/v1/accounts/42/statuses"
+        adapter = api.cfs.get_adapter(url)
+        other_adapter = other.cfs.get_adapter(url)
+        with patch.object(adapter, "send", side_effect=send) as mock_send:
+            with patch.object(other_adapter, "send", side_effect=send) as other_send:
+                first = api.cfs.get(url)
+                second = api.cfs.get(url)
+                from_other = other.cfs.get(url)
+                api.cfs.get(timeline)
+                api.cfs.get(timeline)
+
+        self.assertFalse(first.from_cache)
+        self.assertTrue(second.from_cache)
+        self.assertEqual(second.json(), {"id": "1"})
+        self.assertFalse(from_other.from_cache)
+        other_send.assert_called_once()
+        self.assertEqual(mock_send.call_count, 3)
+        self.assertTrue(os.path.exists(".ts_cache.sqlite"))
+        with open(".ts_cache.sqlite", "rb") as cache_file:
+            self.assertNotIn(self.auth_bearer.encode(), cache_file.read())
+
+    def test_search_pages(self):
+        """Test that search fetches every offset window and drops repeats."""
+        pages = {
+            0: {"accounts": [{"id": "1"}, {"id": "2"}]},
+            2: {"accounts": [{"id": "2"}, {"id": "3"}]},
+            4: {"accounts": []},
+            6: {"accounts": [{"id": "4"}]},
+        }
+
+        def get(url, params=None):
+            return pages[params["offset"]]
+
+        with patch.object(self.api, "_get", side_effect=get) as mock_get:
+            results = list(self.api.search("news", limit=2, max_results=8))
+
+        self.assertEqual(
+            results,
+            [{"accounts": [{"id": "1"}, {"id": "2"}]}, {"accounts": [{"id": "3"}]}],
+        )
+        # Windows still queued behind the empty page may be cancelled
+        self.assertIn(mock_get.call_count, (3, 4))
+
+    def test_search_max_results(self):
+        """Test that max_results caps the results when limit does not divide it."""
+
+        def get(url, params=None):
+            start = params["offset"]
+            return {
+                "statuses": [
+                    {"id": str(i)} for i in range(start, start + params["limit"])
+                ]
+            }
+
+        for max_results, limits in ((100, [40, 40, 20]), (10, [10])):
+            with patch.object(self.api, "_get", side_effect=get) as mock_get:
+                results = list(
+                    self.api.search("news", limit=40, max_results=max_results)
+                )
+            self.assertEqual(
+                sum(len(page["statuses"]) for page in results), max_results
+            )
+            self.assertEqual(
+                [call.kwargs["params"]["limit"] for call in mock_get.call_args_list],
+                limits,
+            )
+
+    def test_search_offsets(self):
+        """Test that max_results counts results from the starting offset."""
+        self.assertEqual(list(_search_offsets(40, 20, 100)), [40, 60, 80, 100, 120])
+        self.assertEqual(list(_search_offsets(200, 50, 100)), [200, 250])
+        self.assertEqual(list(_search_offsets(0, 40, None)), [0])
+        self.assertEqual(list(_search_offsets(0, 0, 100)), [])
+
+    def test_search_error_page(self):
+        """Test that an error page ends the search instead of being yielded."""
+        pages = {0: {"accounts": [{"id": "1"}]}, 2: {"error": "Too many requests"}}
+
+        def get(url, params=None):
+            return pages[params["offset"]]
+
+        with patch.object(self.api, "_get", side_effect=get):
+            results = list(self.api.search("news", limit=2, max_results=4))
+
+        self.assertEqual(results, [{"accounts": [{"id": "1"}]}])
+
+    def test_post_response_partial_data(self):
+        """Test building a post response from null and malformed fields."""
+        response = PostResponse(
+            {"application": None, "tags": [{"name": "news"}, {}], "account": None}
+        )
+        self.assertIsNone(response.application)
+        self.assertEqual(response.tags, ["news"])
+        self.assertIsNone(response.account["username"])
+
+
+class TestSetupLogger(unittest.TestCase):
+    def test_log_level_env(self):
+        """Test that numeric and unknown log levels are accepted."""
+        cases = {"debug": logging.DEBUG, "10": 10, "verbose": logging.INFO}
+        for level, expected in cases.items():
+            name = f"truthautonomy.test.{level}"
+            with patch.dict(os.environ, {"TRUTHAUTONOMY_LOG_LEVEL": level}):
+                configured = setup_logger(name)
+            self.addCleanup(configured.handlers.clear)
+            self.assertEqual(configured.level, expected)
+
+
+class TestAsyncTruthSocial(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self):
+        """Set up an async client with a mocked session."""
+        self.api = AsyncTruthSocial(auth_bearer="test_bearer_token")
+        await self.api.close()
+        self.api.cfs = MagicMock()
+        self.api.cfs.close = AsyncMock()
+
+    async def test_headers_read_only(self):
+        """Test that reassigning the read-only headers updates the session."""
+        async with AsyncTruthSocial(auth_bearer="test_bearer_token") as api:
+            with self.assertRaises(TypeError):
+                api.headers["Authorization"] = "Bearer other_token"
+            api.headers = {"Authorization": "Bearer other_token"}
+            self.assertEqual(api.cfs.headers["Authorization"], "Bearer other_token")
+            self.assertNotIn("Origin", api.cfs.headers)
+
+    async def test_user_followers(self):
+        """Test that async pagination follows the next links until exhausted."""
+        self.api.cfs.get = AsyncMock(
+            side_effect=[
+                mock_response(data={"id": "42"}),
+                mock_response(
+                    data=[{"id": "2"}],
+                    headers={
+                        "Link": '<https://truthsocial.com/api/v1/next>; rel="next"'
+                    },
+                ),
+                mock_response(data=[{"id": "1"}]),
+            ]
+        )
+        followers = [f async for f in self.api.user_followers(user_handle="@user")]
+        self.assertEqual(followers, [{"id": "2"}, {"id": "1"}])
+        self.assertEqual(
+            self.api.cfs.get.call_args_list[-1].args[0],
+            "https://truthsocial.com/api/v1/next",
+        )
+
+    async def test_get_paginated_no_prefetch_past_maximum(self):
+        """Test that no page is prefetched once the caller's maximum is fetched."""
+        self.api.cfs.get = AsyncMock(
+            return_value=mock_response(
+                data=[{"id": "2"}, {"id": "1"}],
+                headers={"Link": '<https://truthsocial.com/api/v1/next>; rel="next"'},
+            )
+        )
+        likes = [user async for user in self.api.user_likes("post/1", top_num=2)]
+        self.assertEqual(likes, [{"id": "2"}, {"id": "1"}])
+        self.api.cfs.get.assert_called_once()
+
+    async def test_get_paginated_cancels_prefetch(self):
+        """Test that closing the pages early cancels the prefetched request."""
+        cancelled = []
+
+        async def get(url, params=None):
+            if url.endswith("/next"):
+                try:
+                    await asyncio.Event().wait()
+                except asyncio.CancelledError:
+                    cancelled.append(url)
+                    raise
+            return mock_response(
+                data=[{"id": "1"}],
+                headers={"Link": '<https://truthsocial.com/api/v1/next>; rel="next"'},
+            )
+
+        self.api.cfs.get = get
+        pages = self.api._get_paginated("/api/v1/accounts/42/followers")
+        self.assertEqual(await pages.__anext__(), [{"id": "1"}])
+        await asyncio.sleep(0)
+        await pages.aclose()
+        await asyncio.sleep(0)
+        self.assertEqual(cancelled, ["https://truthsocial.com/api/v1/next"])
+
+    async def test_lookup_cached(self):
+        """Test that repeated lookups of a handle reuse a copy of the cached user."""
+        self.api.cfs.get = AsyncMock(return_value=mock_response(data={"id": "42"}))
+        (await self.api.lookup("@user"))["id"] = "mutated"
+        self.assertEqual((await self.api.lookup("user"))["id"], "42")
+        self.api.cfs.get.assert_called_once()
+
+    async def test_pull_statuses(self):
+        """Test that statuses are pulled newest first until since_id."""
+        posts = [
+            {"id": "9", "created_at": "2024-01-01T00:00:00.000Z"},
+            {"id": "100", "created_at": "2024-01-03T00:00:00.000Z"},
+            {"id": "10", "created_at": "2024-01-02T00:00:00.000Z"},
+        ]
+        with patch.object(self.api, "lookup", AsyncMock(return_value={"id": "42"})):
+            with patch.object(self.api, "_get", AsyncMock(return_value=posts)):
+                pulled = [
+                    post async for post in self.api.pull_statuses("user", since_id="9")
+                ]
+        self.assertEqual([post["id"] for post in pulled], ["100", "10"])
+
+    async def test_pull_statuses_created_after(self):
+        """Test that pulling statuses stops at posts older than created_after."""
+        pages = [
+            [
+                {"id": "3", "created_at": "2024-03-01T00:00:00.000Z"},
+                {"id": "2", "created_at": "2024-02-01T00:00:00.000Z"},
+            ],
+            [{"id": "1", "created_at": "2024-01-01T00:00:00.000Z"}],
+        ]
+        created_after = datetime(2024, 1, 15, tzinfo=timezone.utc)
+        with patch.object(self.api, "lookup", AsyncMock(return_value={"id": "42"})):
+            with patch.object(self.api, "_get", AsyncMock(side_effect=pages)) as get:
+                pulled = [
+                    post
+                    async for post in self.api.pull_statuses(
+                        "user", created_after=created_after
+                    )
+                ]
+        self.assertEqual([post["id"] for post in pulled], ["3", "2"])
+        self.assertEqual(get.call_args_list[-1].kwargs["params"], {"max_id": "1"})
+
+    async def test_search_pages(self):
+        """Test that search gathers every offset window and drops repeats."""
+        pages = {
+            0: {"accounts": [{"id": "1"}, {"id": "2"}]},
+            2: {"accounts": [{"id": "2"}, {"id": "3"}]},
+            4: {"accounts": []},
+            6: {"accounts": [{"id": "4"}]},
+        }
+
+        async def get(url, params=None):
+            return pages[params["offset"]]
+
+        with patch.object(self.api, "_get", side_effect=get) as mock_get:
+            results = [
+                page async for page in self.api.search("news", limit=2, max_results=8)
+            ]
+
+        self.assertEqual(
+            results,
+            [{"accounts": [{"id": "1"}, {"id": "2"}]}, {"accounts": [{"id": "3"}]}],
+        )
+        self.assertEqual(mock_get.call_count, 4)
+
+    async def test_search_max_results(self):
+        """Test that max_results caps the results when limit does not divide it."""
+
+        async def get(url, params=None):
+            start = params["offset"]
+            return {
+                "statuses": [
+                    {"id": str(i)} for i in range(start, start + params["limit"])
+                ]
+            }
+
+        with patch.object(self.api, "_get", side_effect=get) as mock_get:
+            results = [
+                page
+                async for page in self.api.search("news", limit=40, max_results=100)
+            ]
+        self.assertEqual(sum(len(page["statuses"]) for page in results), 100)
+        self.assertEqual(
+            [call.kwargs["params"]["limit"] for call in mock_get.call_args_list],
+            [40, 40, 20],
+        )
+
+    async def test_search_error_page(self):
+        """Test that an error page ends the search instead of being yielded."""
+        pages = {0: {"accounts": [{"id": "1"}]}, 2: {"error": "Too many requests"}}
+
+        async def get(url, params=None):
+            return pages[params["offset"]]
+
+        with patch.object(self.api, "_get", side_effect=get):
+            results = [
+                page async for page in self.api.search("news", limit=2, max_results=4)
+            ]
+
+        self.assertEqual(results, [{"accounts": [{"id": "1"}]}])
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -1,3 +1,10 @@
 from .api import MediaResponse, PostResponse, TruthSocial, TruthSocialAPIError
+from .async_api import AsyncTruthSocial
 
-__all__ = ["TruthSocial", "TruthSocialAPIError", "PostResponse", "MediaResponse"]
+__all__ = [
+    "TruthSocial",
+    "AsyncTruthSocial",
+    "TruthSocialAPIError",
+    "PostResponse",
+    "MediaResponse",
+]
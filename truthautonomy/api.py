@@ -1,28 +1,315 @@
+import copy
+import hashlib
 import json
+import mimetypes
+import os
 import random
+import re
 import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
-from typing import Any, Iterator, List, Optional
+from types import MappingProxyType
+from typing import Any, Dict, Iterator, List, Mapping, Optional, Tuple
 
 import cloudscraper
-from dateutil.parser import parse as date_parse
+import orjson
+from curl_cffi import CurlMime
+from curl_cffi import requests as curl_requests
+from curl_cffi.requests.exceptions import RequestException
+from requests_toolbelt import MultipartEncoder
+from urllib3.util.retry import Retry
 
 from .exceptions import TruthSocialAPIError
 from .models import MediaResponse, PostResponse
 from .utils import logger
 
+BASE_URL = "https://truthsocial.com"
+MAX_WORKERS = 8
+
+_NEXT_LINK_RE = re.compile(r'<([^>]+)>\s*;\s*rel="next"')
+
+
+def build_headers(auth_bearer: str) -> dict:
+    """
+    Builds the base headers sent with every API request.
+
+    No User-Agent is set, so each session sends the one matching the browser
+    whose TLS fingerprint it presents.
+
+    Args:
+        auth_bearer (str): Bearer token for API authentication.
+
+    Returns:
+        dict: The request headers.
+    """
+    return {
+        "Accept": "*/*",
+        "Authorization": f"Bearer {auth_bearer}",
+        "Origin": BASE_URL,
+        "Referer": BASE_URL,
+    }
+
+
+def _dedupe_search_page(page: dict, seen: set) -> dict:
+    """
+    Drops results that an earlier search page already returned.
+
+    Args:
+        page (dict): A search response, mapping result types to result lists.
+        seen (set): Keys of the results yielded so far, updated in place.
+
+    Returns:
+        dict: The search response without repeated results.
+    """
+    for result_type, results in page.items():
+        if not isinstance(results, list):
+            continue
+        unique = []
+        for result in results:
+            key = (result_type, result.get("id") or result.get("name"))
+            if key not in seen:
+                seen.add(key)
+                unique.append(result)
+        page[result_type] = unique
+    return page
+
+
+def _next_page_link(link_header: str) -> Optional[str]:
+    """
+    Extracts the 'next' page link from pagination headers.
+
+    Args:
+        link_header (str): The 'Link' header value from the API response.
+
+    Returns:
+        Optional[str]: The next page URL or None.
+    """
+    match = _NEXT_LINK_RE.search(link_header)
+    return match.group(1) if match else None
+
+
+def _parse_json(resp) -> Any:
+    """
+    Deserializes a response body, caching the result on the response.
+
+    Args:
+        resp (requests.Response): The response to deserialize.
+
+    Returns:
+        Any: The parsed JSON body.
+    """
+    parsed = getattr(resp, "_parsed", None)
+    if parsed is None:
+        parsed = resp._parsed = orjson.loads(resp.content)
+    return parsed
+
+
+def _cache_key(request, **kwargs) -> str:
+    """
+    Keys a cached response on the request and the bearer token that sent it.
+
+    requests-cache leaves the Authorization header out of its key, so clients
+    with different tokens would otherwise be served each other's responses. The
+    token is only hashed into the key and never written to the cache.
+    """
+    from requests_cache import create_key
+
+    key = create_key(request, **kwargs) + request.headers.get("Authorization", "")
+    return hashlib.blake2b(key.encode(), digest_size=8).hexdigest()
+
+
+def _ratelimit_delay(headers: Mapping[str, str]) -> Optional[int]:
+    """
+    Computes how long to wait once the rate limit is exhausted.
+
+    Args:
+        headers (Mapping[str, str]): The API response headers.
+
+    Returns:
+        Optional[int]: Seconds until the limit resets, or None if requests remain.
+    """
+    remaining = headers.get("X-RateLimit-Remaining")
+    if remaining is None or int(remaining) > 0:
+        return None
+    return int(headers["X-RateLimit-Reset"]) - int(time.time())
+
+
+def _lookup_acct(user_handle: str) -> str:
+    """Normalizes a user handle to the account name used as the lookup key."""
+    assert user_handle
+    return user_handle.removeprefix("@")
+
+
+def _cached_user(cache: dict, acct: str, ttl: float) -> Optional[dict]:
+    """
+    Returns a copy of the cached user for ``acct`` if it is younger than ``ttl``.
+
+    A stale entry is evicted. The copy keeps callers that modify the returned
+    dict from changing the cached one.
+    """
+    cached = cache.get(acct)
+    if cached is None:
+        return None
+    if time.monotonic() - cached[0] >= ttl:
+        del cache[acct]
+        return None
+    return copy.deepcopy(cached[1])
+
+
+def _cache_user(cache: dict, acct: str, user: Optional[dict], maxsize: int):
+    """
+    Caches a copy of a successful lookup result; error responses are not cached.
+
+    Once the cache holds ``maxsize`` users, the oldest entry is evicted.
+    """
+    if not user or "error" in user:
+        return
+    cache.pop(acct, None)
+    if len(cache) >= maxsize:
+        del cache[next(iter(cache))]
+    cache[acct] = (time.monotonic(), copy.deepcopy(user))
+
+
+def _statuses_url(user_id: str, replies: bool = False, pinned: bool = False) -> str:
+    """
+    Builds the URL listing a user's statuses.
+
+    Args:
+        user_id (str): The user ID.
+        replies (bool, optional): If True, include replies. Defaults to False.
+        pinned (bool, optional): If True, list only pinned statuses.
+            Defaults to False.
+
+    Returns:
+        str: The statuses endpoint path with its query string.
+    """
+    url = f"/api/v1/accounts/{user_id}/statuses"
+    if pinned:
+        url += "?pinned=true&with_muted=true"
+    elif not replies:
+        url += "?exclude_replies=true"
+    return url
+
+
+def _sort_statuses(result: List[dict]) -> List[dict]:
+    """Orders a page of statuses newest first and stamps when it was pulled."""
+    posts = sorted(result, key=lambda k: int(k["id"]), reverse=True)
+    pulled_at = datetime.now(timezone.utc).isoformat()
+    for post in posts:
+        post["_pulled"] = pulled_at
+    return posts
+
+
+def _parse_created_at(created_at: str) -> datetime:
+    """Parses a status timestamp, assuming UTC when it carries no offset."""
+    post_at = datetime.fromisoformat(created_at.replace("Z", "+00:00"))
+    if post_at.tzinfo is None:
+        post_at = post_at.replace(tzinfo=timezone.utc)
+    return post_at
+
+
+def _reached_stop(
+    post: dict, created_after: Optional[datetime], since_id: Optional[int]
+) -> bool:
+    """
+    Checks whether a status is at or before the point pulling should stop.
+
+    Args:
+        post (dict): The status.
+        created_after (datetime, optional): Stop at statuses created at or
+            before this time.
+        since_id (int, optional): Stop at statuses with this ID or lower.
+
+    Returns:
+        bool: True if pulling should stop at this status.
+    """
+    if created_after and _parse_created_at(post["created_at"]) <= created_after:
+        return True
+    return bool(since_id and int(post["id"]) <= since_id)
+
+
+def _search_params(
+    query: str,
+    searchtype: str,
+    limit: int,
+    resolve: bool,
+    min_id: str,
+    max_id: Optional[str],
+) -> dict:
+    """Builds the query parameters shared by every page of a search."""
+    return {
+        "q": query,
+        "resolve": resolve,
+        "limit": limit,
+        "type": searchtype,
+        "min_id": min_id,
+        "max_id": max_id,
+    }
+
+
+def _search_offsets(offset: int, limit: int, max_results: Optional[int]) -> range:
+    """
+    Lists the page offsets of a search.
+
+    Args:
+        offset (int): The offset of the first result.
+        limit (int): The number of results per page.
+        max_results (int, optional): The number of results to fetch from
+            ``offset``. Defaults to a single page.
+
+    Returns:
+        range: The offset of each page, empty if ``limit`` is not positive. Its
+            ``stop`` is where the search ends, so the last page may be short.
+    """
+    if limit <= 0:
+        return range(0)
+    count = max_results if max_results is not None else limit
+    return range(offset, offset + count, limit)
+
+
+def _is_empty_search_page(page: Any) -> bool:
+    """
+    Checks whether a search response ends the search.
+
+    That is the case when it has no results of any type, or when it is an
+    error body such as a rate-limit response.
+    """
+    if not page or "error" in page:
+        return True
+    return all(not value for value in page.values())
+
 
 class TruthSocial:
     """Client to interact with the TruthSocial API."""
 
-    BASE_URL = "https://truthsocial.com"
-
-    def __init__(self, auth_bearer: str):
+    BASE_URL = BASE_URL
+    STATUSES_URL = BASE_URL + "/api/v1/statuses"
+    MEDIA_URL = BASE_URL + "/api/v1/media"
+    LOOKUP_CACHE_TTL = 300
+    LOOKUP_CACHE_SIZE = 1024
+    IMPERSONATE = "chrome120"
+    GET_RETRIES = 3
+    RETRY_BACKOFF = 0.3
+    RETRY_STATUSES = frozenset({500, 502, 503, 504})
+    # Idempotent endpoints served from the on-disk cache; every other GET,
+    # timelines and pagination included, always goes to the network.
+    CACHE_URLS_EXPIRE_AFTER = {
+        BASE_URL + "/api/v1/accounts/lookup": 3600,
+        BASE_URL + "/api/v1/trends": 3600,
+        BASE_URL + "/api/v1/groups/tags": 3600,
+    }
+    MAX_WORKERS = MAX_WORKERS
+
+    def __init__(self, auth_bearer: str, cache: bool = False):
         """
         Initializes the TruthSocial client with an authorization bearer token.
 
         Args:
             auth_bearer (str): Bearer token for API authentication.
+            cache (bool, optional): If True, cache lookup, trend and group tag
+                responses on disk for an hour, per bearer token. Requires the
+                ``cache`` extra and uses the ``cloudscraper`` session. Defaults to
+                False.
 
         Raises:
             ValueError: If the bearer token is not provided.
@@ -30,25 +317,143 @@ class TruthSocial:
         if not auth_bearer:
             raise ValueError("Bearer token is required")
 
-        self.headers = {
-            "Accept": "*/*",
-            "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/114.0.0.0 Safari/537.36",
-            "Authorization": f"Bearer {auth_bearer}",
-            "Origin": self.BASE_URL,
-            "Referer": self.BASE_URL,
-        }
-        self.cfs = cloudscraper.create_scraper()
+        self.cfs = self._create_scraper(cache)
+        self._session_headers = dict(self.cfs.headers)
+        self.headers = build_headers(auth_bearer)
+        self._lookup_cache: Dict[str, Tuple[float, dict]] = {}
+        self._rng = random.Random()
+        # Long-lived so its worker threads, and the connections each one's
+        # session handle keeps alive, are reused across calls.
+        self._executor = ThreadPoolExecutor(max_workers=self.MAX_WORKERS)
+
+    def _create_scraper(self, cache: bool = False) -> Any:
+        """
+        Creates the HTTP session shared by every request.
+
+        By default this is a ``curl_cffi`` session impersonating Chrome's TLS
+        fingerprint, which Cloudflare usually serves without a JavaScript
+        challenge. Setting the ``TRUTHAUTONOMY_CLOUDSCRAPER`` environment variable,
+        or enabling the cache, falls back to a ``cloudscraper`` session.
+
+        Args:
+            cache (bool, optional): If True, back the ``CACHE_URLS_EXPIRE_AFTER``
+                endpoints with an on-disk ``requests-cache`` SQLite cache.
+                Defaults to False.
+
+        Returns:
+            Any: The configured session.
+        """
+        if cache or os.environ.get("TRUTHAUTONOMY_CLOUDSCRAPER"):
+            return self._create_cloudscraper(cache)
+        return curl_requests.Session(impersonate=self.IMPERSONATE)
+
+    def _create_cloudscraper(self, cache: bool = False) -> cloudscraper.CloudScraper:
+        """
+        Creates the fallback ``cloudscraper`` session.
+
+        The default HTTPS adapter is replaced with one that keeps a larger pool of
+        keep-alive connections and retries transient failures, so the TLS handshake
+        and Cloudflare clearance cookies are reused across calls.
+
+        Args:
+            cache (bool, optional): If True, back the ``CACHE_URLS_EXPIRE_AFTER``
+                endpoints with an on-disk ``requests-cache`` SQLite cache.
+                Defaults to False.
+
+        Returns:
+            cloudscraper.CloudScraper: The configured scraper session.
+        """
+        if cache:
+            from requests_cache import DO_NOT_CACHE, CacheMixin
+
+            class CachedScraper(CacheMixin, cloudscraper.CloudScraper):
+                """A cloudscraper session with requests-cache support."""
+
+            cfs = CachedScraper.create_scraper(
+                cache_name=".ts_cache",
+                backend="sqlite",
+                expire_after=DO_NOT_CACHE,
+                urls_expire_after=self.CACHE_URLS_EXPIRE_AFTER,
+                allowable_methods=("GET",),
+                key_fn=_cache_key,
+            )
+        else:
+            cfs = cloudscraper.create_scraper()
+        # 429 and 503 are left out: they carry Cloudflare's challenge, which
+        # cloudscraper can only solve if the response reaches it.
+        retries = Retry(total=3, backoff_factor=0.3, status_forcelist=[500, 502, 504])
+        cfs.mount(
+            "https://",
+            cloudscraper.CipherSuiteAdapter(
+                cipherSuite=cfs.cipherSuite,
+                ecdhCurve=cfs.ecdhCurve,
+                server_hostname=cfs.server_hostname,
+                source_address=cfs.source_address,
+                ssl_context=cfs.ssl_context,
+                pool_connections=10,
+                pool_maxsize=20,
+                max_retries=retries,
+            ),
+        )
+        return cfs
+
+    @property
+    def headers(self) -> Mapping[str, str]:
+        """
+        The base headers sent with every request.
+
+        The returned mapping is read-only; assign a new dict to change the headers
+        so the session and the derived header dicts are rebuilt with it.
+        """
+        return MappingProxyType(self._headers)
+
+    @headers.setter
+    def headers(self, headers: Mapping[str, str]):
+        """Sets the base headers and rebuilds the derived header dicts."""
+        self._headers = dict(headers)
+        self.cfs.headers.clear()
+        self.cfs.headers.update({**self._session_headers, **self._headers})
+        self._json_headers = {**self._headers, "Content-Type": "application/json"}
+
+    def __enter__(self) -> "TruthSocial":
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def close(self):
+        """
+        Shuts down the worker threads and closes the underlying session.
+
+        A ``curl_cffi`` session keeps one curl handle per thread and closing it
+        only closes the calling thread's. Queued requests are cancelled and the
+        call waits for the worker threads to exit, which frees the handles they
+        used for pagination, search and uploads.
+        """
+        self._executor.shutdown(wait=True, cancel_futures=True)
+        self.cfs.close()
 
     def _get_paginated(
-        self, url: str, params: dict = None, resume: str = None
+        self,
+        url: str,
+        params: dict = None,
+        resume: str = None,
+        maximum: Optional[int] = None,
     ) -> Iterator:
         """
         Fetches paginated results for a given URL.
 
+        The next page is requested on a background thread as soon as its link is
+        known, so its network round trip overlaps with the caller processing the
+        current page. It is not prefetched once the pages fetched so far already
+        hold ``maximum`` items, since a caller stopping there would never read it.
+
         Args:
             url (str): The URL to fetch.
             params (dict, optional): Additional query parameters.
             resume (str, optional): The pagination token to resume from.
+            maximum (int, optional): The number of items after which the caller
+                stops consuming pages.
 
         Yields:
             dict: Paginated API responses.
@@ -57,46 +462,42 @@ class TruthSocial:
         if resume:
             next_link += f"?max_id={resume}"
 
-        while next_link:
-            resp = self.cfs.get(url, params=params, headers=self.headers)
-            link_header = resp.headers.get("Link", "")
-            next_link = self._get_next_page_link(link_header)
-            logger.info(f"Next: {next_link}, resp: {resp}, headers: {resp.headers}")
-            yield resp.json()
-            self._check_ratelimit(resp)
+        fetched = 0
+        future = self._executor.submit(self._send_get, next_link, params=params)
+        try:
+            while future:
+                resp = future.result()
+                next_link = _next_page_link(resp.headers.get("Link", ""))
+                logger.info("Next: %s", next_link)
+                logger.debug("Response: %s, headers: %s", resp, resp.headers)
+                self._check_ratelimit(resp)
+                page = _parse_json(resp)
+                fetched += len(page)
+                future = None
+                if next_link and (maximum is None or fetched < maximum):
+                    future = self._executor.submit(self._send_get, next_link)
+                yield page
+                if next_link and not future:
+                    future = self._executor.submit(self._send_get, next_link)
+        finally:
+            if future:
+                future.cancel()
 
     def _check_ratelimit(self, response):
         """Checks rate limit headers and applies delay if necessary."""
-        if "X-RateLimit-Remaining" in response.headers:
-            remaining = int(response.headers["X-RateLimit-Remaining"])
-            if remaining == 0:
-                reset = int(response.headers["X-RateLimit-Reset"])
-                delay = reset - int(time.time())
-                logger.warning(f"Rate limit reached. Sleeping for {delay} seconds.")
-                time.sleep(delay)
-
-    def _get_next_page_link(self, link_header: str) -> Optional[str]:
-        """
-        Extracts the 'next' page link from pagination headers.
-
-        Args:
-            link_header (str): The 'Link' header value from the API response.
-
-        Returns:
-            Optional[str]: The next page URL or None.
-        """
-        next_link = None
-        for link in link_header.split(","):
-            parts = link.split(";")
-            if len(parts) == 2 and parts[1].strip() == 'rel="next"':
-                next_link = parts[0].strip("<>")
-                break
-        return next_link
+        delay = _ratelimit_delay(response.headers)
+        if delay is None:
+            return
+        logger.warning(f"Rate limit reached. Sleeping for {delay} seconds.")
+        time.sleep(delay)
 
     def _handle_media_upload(self, media_files: Optional[List[str]]) -> List[int]:
         """
         Handles media uploads and returns a list of media IDs.
 
+        Files are uploaded in parallel on the client's thread pool; the returned
+        IDs keep the order of ``media_files``.
+
         Args:
             media_files (Optional[List[str]]): List of media file paths to upload.
 
@@ -105,11 +506,19 @@ class TruthSocial:
         """
         media_ids = []
         if media_files:
+            entries = []
             for media_file in media_files:
-                if media_file.isdigit():
-                    media_ids.append(int(media_file))
+                try:
+                    entries.append(int(media_file))
+                except ValueError:
+                    entries.append(media_file)
+            paths = [entry for entry in entries if isinstance(entry, str)]
+            uploads = self._executor.map(self.upload_media, paths)
+            for entry in entries:
+                if isinstance(entry, int):
+                    media_ids.append(entry)
                 else:
-                    media_response = self.upload_media(media_file)
+                    media_response = next(uploads)
                     if media_response.id:
                         media_ids.append(media_response.id)
         return media_ids
@@ -132,7 +541,9 @@ class TruthSocial:
         top_num = max(1, int(top_num))
         n_output = 0
         for followers_batch in self._get_paginated(
-            f"/api/v1/statuses/{post}/favourited_by", params={"limit": 80}
+            f"/api/v1/statuses/{post}/favourited_by",
+            params={"limit": 80},
+            maximum=None if include_all else top_num,
         ):
             for f in followers_batch:
                 yield f
@@ -203,7 +614,7 @@ class TruthSocial:
             dict: User information.
         """
         n_output = 0
-        for followers_batch in self._get_paginated(url, resume=resume):
+        for followers_batch in self._get_paginated(url, resume=resume, maximum=maximum):
             for f in followers_batch:
                 yield f
                 n_output += 1
@@ -214,16 +625,22 @@ class TruthSocial:
         """
         Lookup a user's information.
 
+        Results are cached per handle for ``LOOKUP_CACHE_TTL`` seconds, keeping
+        at most ``LOOKUP_CACHE_SIZE`` handles.
+
         Args:
             user_handle (str): The user handle.
 
         Returns:
             Optional[dict]: The user's information.
         """
-        assert user_handle
-        return self._get(
-            f"/api/v1/accounts/lookup", params={"acct": user_handle.removeprefix("@")}
-        )
+        acct = _lookup_acct(user_handle)
+        cached = _cached_user(self._lookup_cache, acct, self.LOOKUP_CACHE_TTL)
+        if cached:
+            return cached
+        user = self._get("/api/v1/accounts/lookup", params={"acct": acct})
+        _cache_user(self._lookup_cache, acct, user, self.LOOKUP_CACHE_SIZE)
+        return user
 
     def send_post(
         self,
@@ -247,36 +664,60 @@ class TruthSocial:
         media_ids = self._handle_media_upload(media_files)
         payload = self._build_post_payload(content, media_ids, visibility, **kwargs)
         response = self.cfs.post(
-            self.BASE_URL + "/api/v1/statuses",
-            headers={**self.headers, "Content-Type": "application/json"},
-            json=payload,
+            self.STATUSES_URL,
+            headers=self._json_headers,
+            data=orjson.dumps(payload),
         )
 
         if response.status_code != 200:
             raise TruthSocialAPIError(response.status_code, response.text)
 
-        return PostResponse(response.json())
+        return PostResponse(_parse_json(response))
 
     def upload_media(self, file_path: str) -> MediaResponse:
         """
         Uploads a media file to the TruthSocial API.
 
+        The file is streamed from disk as a multipart body rather than read into
+        memory up front.
+
         Args:
             file_path (str): Path to the media file.
 
         Returns:
             MediaResponse: The response containing the uploaded media details.
         """
-        with open(file_path, "rb") as file:
-            files = {"file": file}
-            response = self.cfs.post(
-                self.BASE_URL + "/api/v1/media", headers=self.headers, files=files
+        filename = os.path.basename(file_path)
+        content_type = mimetypes.guess_type(file_path)[0] or "application/octet-stream"
+        if isinstance(self.cfs, cloudscraper.CloudScraper):
+            with open(file_path, "rb") as file:
+                encoder = MultipartEncoder(
+                    fields={"file": (filename, file, content_type)}
+                )
+                response = self.cfs.post(
+                    self.MEDIA_URL,
+                    headers={"Content-Type": encoder.content_type},
+                    data=encoder,
+                )
+        else:
+            if not os.path.isfile(file_path):
+                raise FileNotFoundError(file_path)
+            mime = CurlMime()
+            mime.addpart(
+                "file",
+                content_type=content_type,
+                filename=filename,
+                local_path=file_path,
             )
+            try:
+                response = self.cfs.post(self.MEDIA_URL, multipart=mime)
+            finally:
+                mime.close()
 
         if response.status_code != 200:
             raise TruthSocialAPIError(response.status_code, response.text)
 
-        return MediaResponse(response.json())
+        return MediaResponse(_parse_json(response))
 
     def _build_post_payload(self, content, media_ids, visibility, **kwargs):
         """
@@ -307,7 +748,7 @@ class TruthSocial:
         Simulates random user interactions like likes, follows, and reads.
         """
         interactions = ["like", "follow", "read"]
-        action = random.choice(interactions)
+        action = self._rng.choice(interactions)
 
         if action == "like":
             logger.info("User liked a post!")
@@ -323,7 +764,9 @@ class TruthSocial:
         Returns:
             dict: Dictionary containing random trending tags.
         """
-        return {"trending_tags": [f"#{random.choice(['fun', 'news', 'tech', 'life'])}"]}
+        return {
+            "trending_tags": [f"#{self._rng.choice(['fun', 'news', 'tech', 'life'])}"]
+        }
 
     def random_suggestions(self) -> dict:
         """
@@ -332,9 +775,10 @@ class TruthSocial:
         Returns:
             dict: Dictionary with suggested users and groups.
         """
+        ids = range(1, 101)
         return {
-            "suggested_users": [f"User{random.randint(1, 100)}" for _ in range(5)],
-            "suggested_groups": [f"Group{random.randint(1, 100)}" for _ in range(3)],
+            "suggested_users": [f"User{n}" for n in self._rng.choices(ids, k=5)],
+            "suggested_groups": [f"Group{n}" for n in self._rng.choices(ids, k=3)],
         }
 
     def trending(self, limit=10):
@@ -403,9 +847,38 @@ class TruthSocial:
         Returns:
             Any: The response object.
         """
-        return self.cfs.get(
-            self.BASE_URL + url, params=params, headers=self.headers
-        ).json()
+        return _parse_json(self._send_get(self.BASE_URL + url, params=params))
+
+    def _send_get(self, url: str, params: Optional[dict] = None) -> Any:
+        """
+        Sends a GET request, retrying transport errors and 5xx responses.
+
+        Only GETs are retried, since a POST that failed may still have reached the
+        server. A 429 is returned as is, so the rate-limit headers decide how long
+        to wait. The ``cloudscraper`` session already retries through its adapter,
+        so its requests are sent once here.
+
+        Args:
+            url (str): The full URL.
+            params (dict, optional): The query parameters for the request.
+
+        Returns:
+            Any: The response of the last attempt.
+        """
+        retries = self.GET_RETRIES
+        if isinstance(self.cfs, cloudscraper.CloudScraper):
+            retries = 0
+        for attempt in range(retries + 1):
+            if attempt:
+                time.sleep(self.RETRY_BACKOFF * 2 ** (attempt - 1))
+            try:
+                resp = self.cfs.get(url, params=params)
+            except RequestException:
+                if attempt == retries:
+                    raise
+                continue
+            if resp.status_code not in self.RETRY_STATUSES or attempt == retries:
+                return resp
 
     def pull_statuses(
         self,
@@ -418,16 +891,14 @@ class TruthSocial:
     ) -> Iterator[dict]:
         params = {}
         user_id = self.lookup(username)["id"]
+        since_id = int(since_id) if since_id else None
         page_counter = 0
         keep_going = True
 
+        url = _statuses_url(user_id, replies=replies, pinned=pinned)
+
         while keep_going:
             try:
-                url = f"/api/v1/accounts/{user_id}/statuses"
-                if pinned:
-                    url += "?pinned=true&with_muted=true"
-                elif not replies:
-                    url += "?exclude_replies=true"
                 if verbose:
                     logger.debug(f"{url} {params}")
                 result = self._get(url, params=params)
@@ -443,24 +914,18 @@ class TruthSocial:
                 logger.error(f"Error pulling statuses for user #{user_id}: {result}")
                 break
 
-            posts = sorted(result, key=lambda k: k["id"], reverse=True)
+            posts = _sort_statuses(result)
             params["max_id"] = posts[-1]["id"]
 
             if pinned:
                 keep_going = False
 
             for post in posts:
-                post["_pulled"] = datetime.now().isoformat()
-                post_at = date_parse.parse(post["created_at"]).replace(
-                    tzinfo=timezone.utc
-                )
-                if (created_after and post_at <= created_after) or (
-                    since_id and post["id"] <= since_id
-                ):
+                if _reached_stop(post, created_after, since_id):
                     keep_going = False
                     break
                 if verbose:
-                    logger.debug(f"{post['id']} {post['created_at']}")
+                    logger.debug("%s %s", post["id"], post["created_at"])
                 yield post
 
     def pull_comments(
@@ -475,6 +940,7 @@ class TruthSocial:
         for comments_batch in self._get_paginated(
             f"/api/v1/statuses/{post}/context/descendants",
             params=dict(sort="oldest"),
+            maximum=None if include_all or only_first else top_num,
         ):
             for comment in comments_batch:
                 if (only_first and comment["in_reply_to_id"] == post) or not only_first:
@@ -492,22 +958,35 @@ class TruthSocial:
         offset: int = 0,
         min_id: str = "0",
         max_id: Optional[str] = None,
+        max_results: Optional[int] = None,
     ) -> Iterator[dict]:
         """
         searchtype can be accounts|statuses|hashtags|groups
-        """
-        while offset < limit:
-            params = {
-                "q": query,
-                "resolve": resolve,
-                "limit": limit,
-                "type": searchtype,
-                "offset": offset,
-                "min_id": min_id,
-                "max_id": max_id,
-            }
-            resp = self._get("/api/v2/search", params=params)
-            offset += limit
-            if not resp or all(not value for value in resp.values()):
-                break
-            yield resp
+
+        Pages of ``limit`` results are fetched from ``offset`` until
+        ``max_results`` results (a single page by default), up to
+        ``MAX_WORKERS`` pages at a time; the last page only asks for the
+        results still missing. Results repeated across pages are dropped, and
+        the search stops at an empty or error page.
+        """
+        offsets = _search_offsets(offset, limit, max_results)
+        params = _search_params(query, searchtype, limit, resolve, min_id, max_id)
+        seen = set()
+        for start in range(0, len(offsets), self.MAX_WORKERS):
+            pages = self._executor.map(
+                lambda page_offset: self._get(
+                    "/api/v2/search",
+                    params={
+                        **params,
+                        "offset": page_offset,
+                        "limit": min(limit, offsets.stop - page_offset),
+                    },
+                ),
+                offsets[start : start + self.MAX_WORKERS],
+            )
+            for resp in pages:
+                if _is_empty_search_page(resp):
+                    if resp and "error" in resp:
+                        logger.error(f"Error searching for {query!r}: {resp}")
+                    return
+                yield _dedupe_search_page(resp, seen)
@@ -0,0 +1,394 @@
+import asyncio
+import json
+from datetime import datetime
+from types import MappingProxyType
+from typing import Any, AsyncIterator, Dict, Mapping, Optional, Tuple
+
+from curl_cffi.requests import AsyncSession
+
+from .api import (
+    BASE_URL,
+    MAX_WORKERS,
+    _cache_user,
+    _cached_user,
+    _dedupe_search_page,
+    _is_empty_search_page,
+    _lookup_acct,
+    _next_page_link,
+    _parse_json,
+    _ratelimit_delay,
+    _reached_stop,
+    _search_offsets,
+    _search_params,
+    _sort_statuses,
+    _statuses_url,
+    build_headers,
+)
+from .utils import logger
+
+
+class AsyncTruthSocial:
+    """Asyncio client for the streaming TruthSocial API endpoints."""
+
+    BASE_URL = BASE_URL
+    MAX_WORKERS = MAX_WORKERS
+    LOOKUP_CACHE_TTL = 300
+    LOOKUP_CACHE_SIZE = 1024
+
+    def __init__(self, auth_bearer: str, impersonate: str = "chrome120"):
+        """
+        Initializes the async TruthSocial client with an authorization bearer token.
+
+        Requests go through a single ``curl_cffi`` session that impersonates a
+        browser's TLS fingerprint and multiplexes requests over HTTP/2.
+
+        Args:
+            auth_bearer (str): Bearer token for API authentication.
+            impersonate (str, optional): The browser to impersonate. Defaults to
+                'chrome120'.
+
+        Raises:
+            ValueError: If the bearer token is not provided.
+        """
+        if not auth_bearer:
+            raise ValueError("Bearer token is required")
+
+        self.cfs = AsyncSession(impersonate=impersonate)
+        self._session_headers = dict(self.cfs.headers)
+        self.headers = build_headers(auth_bearer)
+        self._lookup_cache: Dict[str, Tuple[float, dict]] = {}
+
+    @property
+    def headers(self) -> Mapping[str, str]:
+        """
+        The base headers sent with every request.
+
+        The returned mapping is read-only; assign a new dict to change the headers
+        so the session is rebuilt with it.
+        """
+        return MappingProxyType(self._headers)
+
+    @headers.setter
+    def headers(self, headers: Mapping[str, str]):
+        """Sets the base headers and rebuilds the session headers."""
+        self._headers = dict(headers)
+        self.cfs.headers.clear()
+        self.cfs.headers.update({**self._session_headers, **self._headers})
+
+    async def __aenter__(self) -> "AsyncTruthSocial":
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.close()
+
+    async def close(self):
+        """Closes the underlying session."""
+        await self.cfs.close()
+
+    async def _get(self, url: str, params: Optional[dict] = None) -> Any:
+        """
+        Helper method to perform GET requests.
+
+        Args:
+            url (str): The endpoint URL.
+            params (dict, optional): The query parameters for the request.
+
+        Returns:
+            Any: The parsed JSON body.
+        """
+        resp = await self.cfs.get(self.BASE_URL + url, params=params)
+        return _parse_json(resp)
+
+    async def _get_paginated(
+        self,
+        url: str,
+        params: dict = None,
+        resume: str = None,
+        maximum: Optional[int] = None,
+    ) -> AsyncIterator:
+        """
+        Fetches paginated results for a given URL.
+
+        The next page is requested as soon as its link is known, so its network
+        round trip overlaps with the caller processing the current page. It is
+        not prefetched once the pages fetched so far already hold ``maximum``
+        items, since a caller stopping there would never read it.
+
+        Args:
+            url (str): The URL to fetch.
+            params (dict, optional): Additional query parameters.
+            resume (str, optional): The pagination token to resume from.
+            maximum (int, optional): The number of items after which the caller
+                stops consuming pages.
+
+        Yields:
+            dict: Paginated API responses.
+        """
+        next_link = self.BASE_URL + url
+        if resume:
+            next_link += f"?max_id={resume}"
+
+        fetched = 0
+        task = asyncio.ensure_future(self.cfs.get(next_link, params=params))
+        try:
+            while task:
+                resp = await task
+                next_link = _next_page_link(resp.headers.get("Link", ""))
+                logger.info("Next: %s", next_link)
+                logger.debug("Response: %s, headers: %s", resp, resp.headers)
+                await self._check_ratelimit(resp)
+                page = _parse_json(resp)
+                fetched += len(page)
+                task = None
+                if next_link and (maximum is None or fetched < maximum):
+                    task = asyncio.ensure_future(self.cfs.get(next_link))
+                yield page
+                if next_link and not task:
+                    task = asyncio.ensure_future(self.cfs.get(next_link))
+        finally:
+            if task:
+                task.cancel()
+
+    async def _check_ratelimit(self, response):
+        """Checks rate limit headers and applies delay if necessary."""
+        delay = _ratelimit_delay(response.headers)
+        if delay is None:
+            return
+        logger.warning(f"Rate limit reached. Sleeping for {delay} seconds.")
+        await asyncio.sleep(delay)
+
+    async def lookup(self, user_handle: str = None) -> Optional[dict]:
+        """
+        Lookup a user's information.
+
+        Results are cached per handle for ``LOOKUP_CACHE_TTL`` seconds, keeping
+        at most ``LOOKUP_CACHE_SIZE`` handles.
+
+        Args:
+            user_handle (str): The user handle.
+
+        Returns:
+            Optional[dict]: The user's information.
+        """
+        acct = _lookup_acct(user_handle)
+        cached = _cached_user(self._lookup_cache, acct, self.LOOKUP_CACHE_TTL)
+        if cached:
+            return cached
+        user = await self._get("/api/v1/accounts/lookup", params={"acct": acct})
+        _cache_user(self._lookup_cache, acct, user, self.LOOKUP_CACHE_SIZE)
+        return user
+
+    async def user_likes(
+        self, post: str, include_all: bool = False, top_num: int = 40
+    ) -> AsyncIterator:
+        """
+        Fetches the users who liked a post.
+
+        Args:
+            post (str): The post URL.
+            include_all (bool, optional): If True, fetch all users who liked the post. Defaults to False.
+            top_num (int, optional): The number of top users to return. Defaults to 40.
+
+        Yields:
+            dict: User information who liked the post.
+        """
+        post = post.split("/")[-1]
+        top_num = max(1, int(top_num))
+        n_output = 0
+        async for followers_batch in self._get_paginated(
+            f"/api/v1/statuses/{post}/favourited_by",
+            params={"limit": 80},
+            maximum=None if include_all else top_num,
+        ):
+            for f in followers_batch:
+                yield f
+                n_output += 1
+                if not include_all and n_output >= top_num:
+                    return
+
+    async def user_followers(
+        self,
+        user_handle: str = None,
+        user_id: str = None,
+        maximum: int = 1000,
+        resume: str = None,
+    ) -> AsyncIterator:
+        """
+        Fetches followers of a user with pagination.
+
+        Args:
+            user_handle (str, optional): The user handle.
+            user_id (str, optional): The user ID.
+            maximum (int, optional): The maximum number of followers to return. Defaults to 1000.
+            resume (str, optional): The pagination token to resume from.
+
+        Yields:
+            dict: User information of followers.
+        """
+        assert user_handle or user_id, "Either user_handle or user_id must be provided"
+        user_id = user_id or (await self.lookup(user_handle))["id"]
+        async for f in self._paginate_user_list(
+            f"/api/v1/accounts/{user_id}/followers", resume, maximum
+        ):
+            yield f
+
+    async def user_following(
+        self,
+        user_handle: str = None,
+        user_id: str = None,
+        maximum: int = 1000,
+        resume: str = None,
+    ) -> AsyncIterator:
+        """
+        Fetches users that a given user is following.
+
+        Args:
+            user_handle (str, optional): The user handle.
+            user_id (str, optional): The user ID.
+            maximum (int, optional): The maximum number of following users to return. Defaults to 1000.
+            resume (str, optional): The pagination token to resume from.
+
+        Yields:
+            dict: User information of following users.
+        """
+        assert user_handle or user_id, "Either user_handle or user_id must be provided"
+        user_id = user_id or (await self.lookup(user_handle))["id"]
+        async for f in self._paginate_user_list(
+            f"/api/v1/accounts/{user_id}/following", resume, maximum
+        ):
+            yield f
+
+    async def _paginate_user_list(
+        self, url: str, resume: str, maximum: int
+    ) -> AsyncIterator:
+        """
+        Helper method to paginate user lists.
+
+        Args:
+            url (str): The URL for the user list.
+            resume (str): The pagination token to resume from.
+            maximum (int): The maximum number of users to return.
+
+        Yields:
+            dict: User information.
+        """
+        n_output = 0
+        async for followers_batch in self._get_paginated(
+            url, resume=resume, maximum=maximum
+        ):
+            for f in followers_batch:
+                yield f
+                n_output += 1
+                if n_output >= maximum:
+                    return
+
+    async def pull_statuses(
+        self,
+        username: str,
+        replies: bool = False,
+        verbose: bool = False,
+        created_after: datetime = None,
+        since_id: Optional[str] = None,
+        pinned: bool = False,
+    ) -> AsyncIterator[dict]:
+        params = {}
+        user_id = (await self.lookup(username))["id"]
+        since_id = int(since_id) if since_id else None
+        keep_going = True
+
+        url = _statuses_url(user_id, replies=replies, pinned=pinned)
+
+        while keep_going:
+            try:
+                if verbose:
+                    logger.debug(f"{url} {params}")
+                result = await self._get(url, params=params)
+            except json.JSONDecodeError as e:
+                logger.error(f"Unable to pull user #{user_id}'s statuses: {e}")
+                break
+            except Exception as e:
+                logger.error(f"Error while pulling statuses for user #{user_id}: {e}")
+                break
+
+            if "error" in result or not result:
+                logger.error(f"Error pulling statuses for user #{user_id}: {result}")
+                break
+
+            posts = _sort_statuses(result)
+            params["max_id"] = posts[-1]["id"]
+
+            if pinned:
+                keep_going = False
+
+            for post in posts:
+                if _reached_stop(post, created_after, since_id):
+                    keep_going = False
+                    break
+                if verbose:
+                    logger.debug("%s %s", post["id"], post["created_at"])
+                yield post
+
+    async def pull_comments(
+        self,
+        post: str,
+        include_all: bool = False,
+        only_first: bool = False,
+        top_num: int = 40,
+    ) -> AsyncIterator[dict]:
+        post = post.split("/")[-1]
+        n_output = 0
+        async for comments_batch in self._get_paginated(
+            f"/api/v1/statuses/{post}/context/descendants",
+            params=dict(sort="oldest"),
+            maximum=None if include_all or only_first else top_num,
+        ):
+            for comment in comments_batch:
+                if (only_first and comment["in_reply_to_id"] == post) or not only_first:
+                    yield comment
+                    n_output += 1
+                    if not include_all and n_output >= top_num:
+                        return
+
+    async def search(
+        self,
+        query: str,
+        searchtype: str = "",
+        limit: int = 40,
+        resolve: bool = True,
+        offset: int = 0,
+        min_id: str = "0",
+        max_id: Optional[str] = None,
+        max_results: Optional[int] = None,
+    ) -> AsyncIterator[dict]:
+        """
+        searchtype can be accounts|statuses|hashtags|groups
+
+        Pages of ``limit`` results are fetched from ``offset`` until
+        ``max_results`` results (a single page by default), up to
+        ``MAX_WORKERS`` pages at a time; the last page only asks for the
+        results still missing. Results repeated across pages are dropped, and
+        the search stops at an empty or error page.
+        """
+        offsets = _search_offsets(offset, limit, max_results)
+        params = _search_params(query, searchtype, limit, resolve, min_id, max_id)
+        seen = set()
+        for start in range(0, len(offsets), self.MAX_WORKERS):
+            pages = await asyncio.gather(
+                *(
+                    self._get(
+                        "/api/v2/search",
+                        params={
+                            **params,
+                            "offset": page_offset,
+                            "limit": min(limit, offsets.stop - page_offset),
+                        },
+                    )
+                    for page_offset in offsets[start : start + self.MAX_WORKERS]
+                )
+            )
+            for resp in pages:
+                if _is_empty_search_page(resp):
+                    if resp and "error" in resp:
+                        logger.error(f"Error searching for {query!r}: {resp}")
+                    return
+                yield _dedupe_search_page(resp, seen)
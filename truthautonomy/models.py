@@ -4,6 +4,8 @@ from typing import Any, Dict, List, Optional
 class MediaResponse:
     """Represents the response for a media upload."""
 
+    __slots__ = ("id", "type", "url", "preview_url", "text_url", "meta")
+
     def __init__(self, data: Dict[str, Any]):
         self.id: Optional[int] = data.get("id")
         self.type: Optional[str] = data.get("type")
@@ -16,6 +18,20 @@ class MediaResponse:
 class PostResponse:
     """Represents the response for a post creation."""
 
+    __slots__ = (
+        "id",
+        "created_at",
+        "content",
+        "visibility",
+        "url",
+        "replies_count",
+        "reblogs_count",
+        "favourites_count",
+        "application",
+        "tags",
+        "account",
+    )
+
     def __init__(self, data: Dict[str, Any]):
         self.id: Optional[int] = data.get("id")
         self.created_at: Optional[str] = data.get("created_at")
@@ -25,9 +41,11 @@ class PostResponse:
         self.replies_count: Optional[int] = data.get("replies_count")
         self.reblogs_count: Optional[int] = data.get("reblogs_count")
         self.favourites_count: Optional[int] = data.get("favourites_count")
-        self.application: Optional[str] = data.get("application", {}).get("name")
-        self.tags: List[str] = [tag.get("name") for tag in data.get("tags", [])]
-        account_data = data.get("account", {})
+        self.application: Optional[str] = (data.get("application") or {}).get("name")
+        self.tags: List[str] = [
+            tag["name"] for tag in data.get("tags") or () if "name" in tag
+        ]
+        account_data = data.get("account") or {}
         self.account: Dict[str, Any] = {
             "username": account_data.get("username"),
             "id": account_data.get("id"),
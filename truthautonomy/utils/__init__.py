@@ -1,10 +1,41 @@
 import logging
+import os
+
+# Shared by every console handler the package attaches
+FORMATTER = logging.Formatter("%(asctime)s - %(name)s - %(levelname)s - %(message)s")
+
+# Used when TRUTHAUTONOMY_LOG_LEVEL is set to a name logging doesn't know
+DEFAULT_LEVEL = logging.INFO
+
+
+def parse_level(level: str) -> int:
+    """
+    Converts a level name (e.g. ``debug``) or number (e.g. ``10``) to a level.
+
+    Unknown names fall back to ``DEFAULT_LEVEL`` instead of raising.
+
+    Args:
+        level (str): The level name or number.
+
+    Returns:
+        int: The logging level.
+    """
+    level = level.strip()
+    if level.isdigit():
+        return int(level)
+    value = logging.getLevelName(level.upper())
+    return value if isinstance(value, int) else DEFAULT_LEVEL
 
 
 def setup_logger(name: str) -> logging.Logger:
     """
     Sets up a logger for the given name.
 
+    The logger only gets a ``NullHandler`` by default, leaving output to the
+    application's logging configuration. Set the ``TRUTHAUTONOMY_LOG_LEVEL``
+    environment variable (e.g. ``INFO``, ``DEBUG`` or ``10``) to log to the
+    console.
+
     Args:
         name (str): The name of the logger. Typically the module name.
 
@@ -13,22 +44,18 @@ def setup_logger(name: str) -> logging.Logger:
     """
     # Create a logger
     logger = logging.getLogger(name)
+    if logger.handlers:
+        return logger
 
-    # Set the logging level (you can change this to DEBUG, ERROR, etc. based on needs)
-    logger.setLevel(logging.INFO)
-
-    # Create a console handler and set the log level
-    ch = logging.StreamHandler()
-    ch.setLevel(logging.INFO)
-
-    # Create a formatter and set it for the handler
-    formatter = logging.Formatter(
-        "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
-    )
-    ch.setFormatter(formatter)
+    logger.addHandler(logging.NullHandler())
 
-    # Add the handler to the logger
-    logger.addHandler(ch)
+    level = os.environ.get("TRUTHAUTONOMY_LOG_LEVEL")
+    if level:
+        # Create a console handler using the shared formatter
+        logger.setLevel(parse_level(level))
+        ch = logging.StreamHandler()
+        ch.setFormatter(FORMATTER)
+        logger.addHandler(ch)
 
     return logger
 